@@ -1,8 +1,13 @@
+import importlib
 import importlib.resources
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any
 
-import arviz as az
 import polars as pl
 
+from forecasttools import constants
 from forecasttools.constants import (
     ALL_LOCATION_CODES,
     COVID_HUB_LOCATIONS,
@@ -22,7 +27,6 @@ from forecasttools.constants import (
     TERRITORY_LOCATION_CODES,
     VALID_DISEASES,
     VALID_TARGET_TYPES,
-    location_table,
 )
 from forecasttools.daily_to_epiweekly import df_aggregate_to_epiweekly
 from forecasttools.pull_data_cdc_gov import (
@@ -51,47 +55,127 @@ from forecasttools.utils import (
     validate_iter_has_expected_types,
 )
 
-from . import arviz
+# root of the forecasttools package resources, looked up
+# once and shared by the paths below
+_PKG_ROOT = importlib.resources.files(__package__)
 
-# state names (for backwards compatibility)
-united_states: list[str] = (
-    location_table.filter(pl.col("is_state")).get_column("long_name").to_list()
-)
-
-# load example flusight submission
-example_flusight_submission_path = importlib.resources.files(__package__).joinpath(
+# paths to the example datasets bundled with forecasttools
+example_flusight_submission_path = _PKG_ROOT.joinpath(
     "example_flusight_submission.parquet"
 )
-dtypes_d = {"location": pl.Utf8}
-example_flusight_submission = pl.read_parquet(example_flusight_submission_path)
-
-# load example fitting data for COVID
-# (NHSN, as of 2024-09-26)
-nhsn_hosp_COVID_path = importlib.resources.files(__package__).joinpath(
-    "nhsn_hosp_COVID.parquet"
-)
-nhsn_hosp_COVID = pl.read_parquet(nhsn_hosp_COVID_path)
-
-# load example fitting data for influenza
-# (NHSN, as of 2024-09-26)
-nhsn_hosp_flu_path = importlib.resources.files(__package__).joinpath(
-    "nhsn_hosp_flu.parquet"
-)
-nhsn_hosp_flu = pl.read_parquet(nhsn_hosp_flu_path)
-
-# load idata NHSN influenza forecast
-# (NHSN, as of 2024-09-26) without dates
-example_flu_forecast_wo_dates_path = importlib.resources.files(__package__).joinpath(
+nhsn_hosp_COVID_path = _PKG_ROOT.joinpath("nhsn_hosp_COVID.parquet")
+nhsn_hosp_flu_path = _PKG_ROOT.joinpath("nhsn_hosp_flu.parquet")
+example_flu_forecast_wo_dates_path = _PKG_ROOT.joinpath(
     "example_flu_forecast_wo_dates.nc"
 )
-nhsn_flu_forecast_wo_dates = az.from_netcdf(example_flu_forecast_wo_dates_path)
-
-# load idata NHSN influenza forecast
-# (NHSN, as of 2024-09-26) with dates
-example_flu_forecast_w_dates_path = importlib.resources.files(__package__).joinpath(
+example_flu_forecast_w_dates_path = _PKG_ROOT.joinpath(
     "example_flu_forecast_w_dates.nc"
 )
-nhsn_flu_forecast_w_dates = az.from_netcdf(example_flu_forecast_w_dates_path)
+
+
+def _load_united_states() -> list[str]:
+    # state names (for backwards compatibility)
+    return (
+        constants.location_table.filter(pl.col("is_state"))
+        .get_column("long_name")
+        .to_list()
+    )
+
+
+def _read_netcdf(path):
+    # arviz is only needed for the idata examples
+    import arviz as az
+
+    return az.from_netcdf(path)
+
+
+# the example datasets are loaded on first access (see
+# __getattr__ below) rather than at import time, so that
+# importing forecasttools does not pay for reading them
+_LAZY_DATA_LOADERS: dict[str, Callable[[], Any]] = {
+    # US jurisdictions (read on first access
+    # in forecasttools.constants)
+    "location_table": partial(getattr, constants, "location_table"),
+    "united_states": _load_united_states,
+    # example flusight submission
+    "example_flusight_submission": partial(
+        pl.read_parquet, example_flusight_submission_path
+    ),
+    # example fitting data for COVID
+    # (NHSN, as of 2024-09-26)
+    "nhsn_hosp_COVID": partial(pl.read_parquet, nhsn_hosp_COVID_path),
+    # example fitting data for influenza
+    # (NHSN, as of 2024-09-26)
+    "nhsn_hosp_flu": partial(pl.read_parquet, nhsn_hosp_flu_path),
+    # idata NHSN influenza forecast
+    # (NHSN, as of 2024-09-26) without dates
+    "nhsn_flu_forecast_wo_dates": partial(
+        _read_netcdf, example_flu_forecast_wo_dates_path
+    ),
+    # idata NHSN influenza forecast
+    # (NHSN, as of 2024-09-26) with dates
+    "nhsn_flu_forecast_w_dates": partial(
+        _read_netcdf, example_flu_forecast_w_dates_path
+    ),
+}
+
+
+# loads started by warmup() that have not been accessed yet
+_pending_loads: dict[str, Future] = {}
+
+
+def warmup(max_workers: int = 4) -> None:
+    """
+    Starts loading all of the example datasets
+    bundled with forecasttools in a pool of
+    background threads, so that the reads
+    overlap rather than happening one after
+    another on first access. Returns without
+    waiting; accessing a dataset afterwards
+    blocks only until its own load finishes.
+
+    Parameters
+    ----------
+    max_workers : int
+        The number of threads used for
+        loading. Defaults to 4.
+
+    Returns
+    -------
+    None
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    for name, loader in _LAZY_DATA_LOADERS.items():
+        if name not in globals() and name not in _pending_loads:
+            _pending_loads[name] = executor.submit(loader)
+    # the worker threads finish the submitted
+    # loads, but take no new work
+    executor.shutdown(wait=False)
+
+
+# submodules that are only imported on first access, since
+# forecasttools.arviz pulls in arviz, xarray, and matplotlib
+_LAZY_SUBMODULES: frozenset[str] = frozenset({"arviz"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        # importing the submodule also binds it as an
+        # attribute of this package
+        return importlib.import_module(f"{__name__}.{name}")
+    loader = _LAZY_DATA_LOADERS.get(name)
+    if loader is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    future = _pending_loads.pop(name, None)
+    value = future.result() if future is not None else loader()
+    # cache in the module namespace so later lookups
+    # no longer go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_DATA_LOADERS) | _LAZY_SUBMODULES)
 
 
 __all__ = [
@@ -113,7 +197,9 @@ __all__ = [
     "HUBVERSE_SUBMISSION_COLUMNS",
     "HUB_URLS",
     "HUB_TASKS_JSON_URLS",
-    # location codes (derived from location_table)
+    # location codes (hardcoded from location_table; checked by
+    # tests/test_constants.py, regenerated by
+    # scripts/regenerate_constants.py)
     "ALL_LOCATION_CODES",
     "STATE_LOCATION_CODES",
     "TERRITORY_LOCATION_CODES",
@@ -145,5 +231,6 @@ __all__ = [
     "get_data_cdc_gov_dataset",
     "get_nhsn",
     "coalesce_common_columns",
+    "warmup",
     "arviz",
 ]
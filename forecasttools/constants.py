@@ -5,18 +5,63 @@ disease forecast hubs including quantile levels, forecast
 horizons, disease-specific column mappings, target
 definitions, and hub location lists.
 
-Location codes are derived programmatically from the
-location_table.parquet file (Census data).
+Location codes are hardcoded from the location_table.parquet
+file (Census data) so that they need not be derived at every
+import; tests/test_constants.py checks that they still match,
+and scripts/regenerate_constants.py regenerates them.
 """
 
+import bisect
 import importlib.resources
+import threading
+from typing import Any
 
 import polars as pl
 
-_location_table_path = importlib.resources.files(__package__).joinpath(
-    "location_table.parquet"
+# root of the forecasttools package resources
+_PKG_ROOT = importlib.resources.files(__package__)
+
+_location_table_path = _PKG_ROOT.joinpath("location_table.parquet")
+
+# the full location table is read on first access (see
+# __getattr__ below), since only location lookups need
+# all of its columns
+location_table: pl.DataFrame
+
+
+# guards the first read of location_table, which
+# forecasttools.warmup() can trigger from several
+# threads at once
+_location_table_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> Any:
+    if name != "location_table":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _location_table_lock:
+        # another thread may have read the table
+        # while this one waited for the lock
+        value = globals().get(name)
+        if value is None:
+            value = pl.read_parquet(_location_table_path, memory_map=True)
+            # cache in the module namespace so later
+            # lookups no longer go through __getattr__
+            globals()[name] = value
+    return value
+
+
+# lookups between location abbreviations and location
+# codes, built once for recoding location columns; the
+# scan reads only the two columns needed from the file
+_ABBR_TO_CODE: dict[str, str] = dict(
+    pl.scan_parquet(_location_table_path)
+    .select("short_name", "location_code")
+    .collect()
+    .iter_rows()
 )
-location_table: pl.DataFrame = pl.read_parquet(_location_table_path)
+_CODE_TO_ABBR: dict[str, str] = {code: abbr for abbr, code in _ABBR_TO_CODE.items()}
+_VALID_ABBRS: frozenset[str] = frozenset(_ABBR_TO_CODE)
+_VALID_CODES: frozenset[str] = frozenset(_CODE_TO_ABBR)
 
 
 # standard hubverse quantile levels (23 levels)
@@ -110,56 +155,172 @@ HUB_TASKS_JSON_URLS: dict[str, str] = {
 }
 
 # all location codes from Census data
-ALL_LOCATION_CODES: list[str] = location_table.get_column("location_code").to_list()
+ALL_LOCATION_CODES: list[str] = [
+    "US",  # United States
+    "01",  # AL
+    "02",  # AK
+    "04",  # AZ
+    "05",  # AR
+    "06",  # CA
+    "08",  # CO
+    "09",  # CT
+    "10",  # DE
+    "11",  # DC
+    "12",  # FL
+    "13",  # GA
+    "15",  # HI
+    "16",  # ID
+    "17",  # IL
+    "18",  # IN
+    "19",  # IA
+    "20",  # KS
+    "21",  # KY
+    "22",  # LA
+    "23",  # ME
+    "24",  # MD
+    "25",  # MA
+    "26",  # MI
+    "27",  # MN
+    "28",  # MS
+    "29",  # MO
+    "30",  # MT
+    "31",  # NE
+    "32",  # NV
+    "33",  # NH
+    "34",  # NJ
+    "35",  # NM
+    "36",  # NY
+    "37",  # NC
+    "38",  # ND
+    "39",  # OH
+    "40",  # OK
+    "41",  # OR
+    "42",  # PA
+    "44",  # RI
+    "45",  # SC
+    "46",  # SD
+    "47",  # TN
+    "48",  # TX
+    "49",  # UT
+    "50",  # VT
+    "51",  # VA
+    "53",  # WA
+    "54",  # WV
+    "55",  # WI
+    "56",  # WY
+    "60",  # AS
+    "66",  # GU
+    "69",  # MP
+    "72",  # PR
+    "74",  # UM
+    "78",  # VI
+]
 
 # 50 US state FIPS codes (is_state=True in location_table)
-STATE_LOCATION_CODES: list[str] = (
-    location_table.filter(pl.col("is_state"))
-    .sort("location_code")
-    .get_column("location_code")
-    .to_list()
-)
+STATE_LOCATION_CODES: list[str] = [
+    "01",  # AL
+    "02",  # AK
+    "04",  # AZ
+    "05",  # AR
+    "06",  # CA
+    "08",  # CO
+    "09",  # CT
+    "10",  # DE
+    "12",  # FL
+    "13",  # GA
+    "15",  # HI
+    "16",  # ID
+    "17",  # IL
+    "18",  # IN
+    "19",  # IA
+    "20",  # KS
+    "21",  # KY
+    "22",  # LA
+    "23",  # ME
+    "24",  # MD
+    "25",  # MA
+    "26",  # MI
+    "27",  # MN
+    "28",  # MS
+    "29",  # MO
+    "30",  # MT
+    "31",  # NE
+    "32",  # NV
+    "33",  # NH
+    "34",  # NJ
+    "35",  # NM
+    "36",  # NY
+    "37",  # NC
+    "38",  # ND
+    "39",  # OH
+    "40",  # OK
+    "41",  # OR
+    "42",  # PA
+    "44",  # RI
+    "45",  # SC
+    "46",  # SD
+    "47",  # TN
+    "48",  # TX
+    "49",  # UT
+    "50",  # VT
+    "51",  # VA
+    "53",  # WA
+    "54",  # WV
+    "55",  # WI
+    "56",  # WY
+]
 
 # DC and territory FIPS codes (is_state=False, excluding US)
-TERRITORY_LOCATION_CODES: list[str] = (
-    location_table.filter(~pl.col("is_state") & (pl.col("location_code") != "US"))
-    .sort("location_code")
-    .get_column("location_code")
-    .to_list()
-)
+TERRITORY_LOCATION_CODES: list[str] = [
+    "11",  # DC
+    "60",  # AS
+    "66",  # GU
+    "69",  # MP
+    "72",  # PR
+    "74",  # UM
+    "78",  # VI
+]
 
 # individual territory codes for convenience
 DC_FIPS: str = "11"
 PR_FIPS: str = "72"
 
 
-# hub locations are built from location_table data
+# hub locations are built from the location codes above
 # all three hubs currently accept: US + 50 states + DC + PR (53 locations)
 # locations are sorted in FIPS order with US first
 def _build_hub_locations() -> list[str]:
     """Build hub location list: US + states + DC + PR in FIPS order."""
-    # get states + DC + PR, sorted by FIPS code
-    hub_codes = (
-        location_table.filter(
-            pl.col("is_state")  # 50 states
-            | (pl.col("location_code") == DC_FIPS)  # DC
-            | (pl.col("location_code") == PR_FIPS)  # PR
-        )
-        .sort("location_code")
-        .get_column("location_code")
-        .to_list()
+    # STATE_LOCATION_CODES is already in FIPS order, so
+    # DC only needs splicing in at its sorted position
+    # (PR sorts after every state)
+    dc_pos = bisect.bisect_left(STATE_LOCATION_CODES, DC_FIPS)
+    return (
+        ["US"]
+        + STATE_LOCATION_CODES[:dc_pos]
+        + [DC_FIPS]
+        + STATE_LOCATION_CODES[dc_pos:]
+        + [PR_FIPS]
     )
-    return ["US"] + hub_codes
 
 
-# all three hubs currently have the same 53 locations
-FLUSIGHT_LOCATIONS: list[str] = _build_hub_locations()
-COVID_HUB_LOCATIONS: list[str] = _build_hub_locations()
-RSV_HUB_LOCATIONS: list[str] = _build_hub_locations()
+# all three hubs currently have the same 53 locations, so they
+# share a single immutable tuple
+_HUB_LOCATIONS_TUPLE: tuple[str, ...] = tuple(_build_hub_locations())
+FLUSIGHT_LOCATIONS: tuple[str, ...] = _HUB_LOCATIONS_TUPLE
+COVID_HUB_LOCATIONS: tuple[str, ...] = _HUB_LOCATIONS_TUPLE
+RSV_HUB_LOCATIONS: tuple[str, ...] = _HUB_LOCATIONS_TUPLE
 
-# mapping from hub name to location list
-HUB_LOCATIONS: dict[str, list[str]] = {
+# mapping from hub name to location tuple
+HUB_LOCATIONS: dict[str, tuple[str, ...]] = {
     "flusight": FLUSIGHT_LOCATIONS,
     "covid": COVID_HUB_LOCATIONS,
     "rsv": RSV_HUB_LOCATIONS,
 }
+
+# hub locations as Polars Series, built once so that filtering
+# with is_in does not rebuild the lookup from a list each call
+HUB_LOCATION_SERIES: dict[str, pl.Series] = {
+    hub: pl.Series("location", locations, dtype=pl.Utf8)
+    for hub, locations in HUB_LOCATIONS.items()
+}
@@ -7,7 +7,55 @@ codes or two-letter abbreviations.
 import polars as pl
 
 import forecasttools
-from forecasttools.constants import HUB_LOCATIONS
+from forecasttools.constants import (
+    _ABBR_TO_CODE,
+    _CODE_TO_ABBR,
+    _VALID_ABBRS,
+    _VALID_CODES,
+    HUB_LOCATION_SERIES,
+    HUB_LOCATIONS,
+)
+
+# location_table column for each location format
+_LOCATION_FORMAT_COLS: dict[str, str] = {
+    "abbr": "short_name",
+    "hubverse": "location_code",
+    "long_name": "long_name",
+}
+
+# valid hub names, for checking hub arguments
+_HUB_KEYS: frozenset[str] = frozenset(HUB_LOCATIONS)
+
+# location vectors up to this length are looked
+# up by first filtering location_table with is_in
+_LOCATION_LOOKUP_FILTER_MAX = 64
+
+
+def _validate_df_and_col(df: pl.DataFrame, location_col: str) -> None:
+    """
+    Checks the dataframe and location column
+    arguments shared by the location recoding
+    and filtering functions, raising on the
+    first failing check.
+    """
+    # check inputted variable types (exact type
+    # checks, which are cheaper than isinstance)
+    if type(df) is not pl.DataFrame:
+        raise TypeError(f"Expected a Polars DataFrame; got {type(df)}.")
+    if type(location_col) is not str:
+        raise TypeError(
+            f"Expected a string for location_col; got {type(location_col)}."
+        )
+    # check if dataframe entered is empty
+    if df.height == 0:
+        raise ValueError("The dataframe is empty.")
+    # check if the location column exists
+    # in the inputted dataframe
+    cols = df.columns
+    if location_col not in cols:
+        raise ValueError(
+            f"Column '{location_col}' not found in the dataframe; got {cols}."
+        )
 
 
 def loc_abbr_to_hubverse_code(df: pl.DataFrame, location_col: str) -> pl.DataFrame:
@@ -36,43 +84,26 @@ def loc_abbr_to_hubverse_code(df: pl.DataFrame, location_col: str) -> pl.DataFra
         column formatted as hubverse location
         codes.
     """
-    # check inputted variable types
-    if not isinstance(df, pl.DataFrame):
-        raise TypeError(f"Expected a Polars DataFrame; got {type(df)}.")
-    if not isinstance(location_col, str):
-        raise TypeError(
-            f"Expected a string for location_col; got {type(location_col)}."
-        )
-    # check if dataframe entered is empty
-    if df.is_empty():
-        raise ValueError(f"The dataframe {df} is empty.")
-    # check if the location column exists
-    # in the inputted dataframe
-    if location_col not in df.columns:
-        raise ValueError(
-            f"Column '{location_col}' not found in the dataframe; got {df.columns}."
-        )
-    # get location table from forecasttools
-    loc_table = forecasttools.location_table
-    # check if values in location_col are a
-    # subset of short_name in location table
-    location_values = set(df[location_col].to_list())
-    valid_values = set(loc_table["short_name"].to_list())
-    difference = location_values.difference(valid_values)
-    if difference:
-        raise ValueError(
-            f"The following values in '{location_col}') are not valid"
-            f" jurisdictional codes: {difference}."
-        )
+    _validate_df_and_col(df, location_col)
     # recode existing location abbreviations
-    # with location codes
-    loc_recoded_df = df.with_columns(
-        pl.col(location_col).replace(
-            old=loc_table["short_name"],
-            new=loc_table["location_code"],
-        )
+    # with location codes; replace_strict fails
+    # on values missing from short_name in the
+    # location table (but lets nulls through), so
+    # invalid values only need finding on failure
+    location_values = df.get_column(location_col)
+    if location_values.null_count() == 0:
+        try:
+            loc_recoded_df = df.with_columns(
+                pl.col(location_col).replace_strict(_ABBR_TO_CODE)
+            )
+            return loc_recoded_df
+        except pl.exceptions.InvalidOperationError:
+            pass
+    difference = set(location_values.unique().to_list()).difference(_VALID_ABBRS)
+    raise ValueError(
+        f"The following values in '{location_col}') are not valid"
+        f" jurisdictional codes: {difference}."
     )
-    return loc_recoded_df
 
 
 def loc_hubverse_code_to_abbr(df: pl.DataFrame, location_col: str) -> pl.DataFrame:
@@ -101,42 +132,27 @@ def loc_hubverse_code_to_abbr(df: pl.DataFrame, location_col: str) -> pl.DataFra
         column formatted as US two-letter
         jurisdictional abbreviations.
     """
-    # check inputted variable types
-    if not isinstance(df, pl.DataFrame):
-        raise TypeError(f"Expected a Polars DataFrame; got {type(df)}.")
-    if not isinstance(location_col, str):
-        raise TypeError(
-            f"Expected a string for location_col; got {type(location_col)}."
-        )
-    # check if dataframe entered is empty
-    if df.is_empty():
-        raise ValueError(f"The dataframe {df} is empty.")
-    # check if the location column exists
-    # in the inputted dataframe
-    if location_col not in df.columns:
-        raise ValueError(
-            f"Column '{location_col}' not found in the dataframe; got {df.columns}."
-        )
-    # get location table from forecasttools
-    loc_table = forecasttools.location_table
-    # check if values in location_col are a
-    # subset of location_code in location table
-    location_values = set(df[location_col].to_list())
-    valid_values = set(loc_table["location_code"].to_list())
-    difference = location_values.difference(valid_values)
-    if difference:
-        raise ValueError(
-            f"Some values in {difference} (in col '{location_col}')"
-            f" are not valid jurisdictional codes."
-        )
+    _validate_df_and_col(df, location_col)
     # recode existing location codes with
-    # with location abbreviations
-    loc_recoded_df = df.with_columns(
-        pl.col(location_col).replace(
-            old=loc_table["location_code"], new=loc_table["short_name"]
-        )
+    # location abbreviations; replace_strict
+    # fails on values missing from location_code
+    # in the location table (but lets nulls
+    # through), so invalid values only need
+    # finding on failure
+    location_values = df.get_column(location_col)
+    if location_values.null_count() == 0:
+        try:
+            loc_recoded_df = df.with_columns(
+                pl.col(location_col).replace_strict(_CODE_TO_ABBR)
+            )
+            return loc_recoded_df
+        except pl.exceptions.InvalidOperationError:
+            pass
+    difference = set(location_values.unique().to_list()).difference(_VALID_CODES)
+    raise ValueError(
+        f"Some values in {difference} (in col '{location_col}')"
+        f" are not valid jurisdictional codes."
     )
-    return loc_recoded_df
 
 
 def to_location_table_column(location_format: str) -> str:
@@ -160,20 +176,14 @@ def to_location_table_column(location_format: str) -> str:
         from the location table.
     """
     # check inputted variable type
-    assert isinstance(location_format, str), (
-        f"Expected a string; got {type(location_format)}."
-    )
+    if not isinstance(location_format, str):
+        raise TypeError(f"Expected a string; got {type(location_format)}.")
     # return proper column name from input format
-    col_dict = {
-        "abbr": "short_name",
-        "hubverse": "location_code",
-        "long_name": "long_name",
-    }
-    col = col_dict.get(location_format)
+    col = _LOCATION_FORMAT_COLS.get(location_format)
     if col is None:
         raise KeyError(
             f"Unknown location format {location_format}."
-            f" Expected one of:\n{col_dict.keys()}."
+            f" Expected one of:\n{_LOCATION_FORMAT_COLS.keys()}."
         )
     return col
 
@@ -219,29 +229,35 @@ def location_lookup(location_vector: list[str], location_format: str) -> pl.Data
         raise TypeError("All elements in location_vector must be of type str.")
     if not isinstance(location_format, str):
         raise TypeError(f"Expected a string; got {type(location_format)}.")
-    valid_formats = ["abbr", "hubverse", "long_name"]
-    if location_format not in valid_formats:
+    if location_format not in _LOCATION_FORMAT_COLS:
         raise ValueError(
             f"Invalid location format '{location_format}'."
-            f" Expected one of: {valid_formats}."
+            f" Expected one of: {list(_LOCATION_FORMAT_COLS)}."
         )
     # check that location vector not empty
     if not location_vector:
         raise ValueError("The location_vector is empty.")
     # get the join key based on the location format
     join_key = forecasttools.to_location_table_column(location_format)
-    # create a dataframe for the location
-    # vector with the column cast as string
-    locs_df = pl.DataFrame({join_key: [str(loc) for loc in location_vector]})
+    location_table = forecasttools.location_table
+    # for short location vectors, narrow the
+    # location_table down with an is_in filter
+    # before joining
+    if len(location_vector) <= _LOCATION_LOOKUP_FILTER_MAX:
+        location_table = location_table.filter(pl.col(join_key).is_in(location_vector))
+    # create a dataframe for the location vector
+    # (elements were checked to be strings above)
+    locs_df = pl.DataFrame({join_key: location_vector}, schema={join_key: pl.Utf8})
     # inner join with the location_table
-    # based on the join key
-    locs = locs_df.join(forecasttools.location_table, on=join_key, how="inner")
+    # based on the join key, keeping the order
+    # of the location vector
+    locs = locs_df.join(location_table, on=join_key, how="inner", maintain_order="left")
     return locs
 
 
-def get_hub_locations(hub: str = "flusight") -> list[str]:
+def get_hub_locations(hub: str = "flusight") -> tuple[str, ...]:
     """
-    Get list of valid location codes for a forecast hub.
+    Get the valid location codes for a forecast hub.
 
     Parameters
     ----------
@@ -250,8 +266,11 @@ def get_hub_locations(hub: str = "flusight") -> list[str]:
 
     Returns
     -------
-    list[str]
-        List of valid FIPS location codes for the specified hub.
+    tuple[str, ...]
+        Tuple of valid FIPS location codes for the specified hub.
+        This is the tuple stored in HUB_LOCATIONS, not a copy;
+        earlier versions returned a new list, so callers that
+        modify the result should copy it with ``list()`` first.
 
     Raises
     ------
@@ -261,10 +280,10 @@ def get_hub_locations(hub: str = "flusight") -> list[str]:
     if not isinstance(hub, str):
         raise TypeError(f"Expected a string for hub; got {type(hub)}.")
     hub_lower = hub.lower()
-    if hub_lower not in HUB_LOCATIONS:
+    if hub_lower not in _HUB_KEYS:
         valid_hubs = list(HUB_LOCATIONS.keys())
         raise ValueError(f"Unknown hub '{hub}'. Expected one of: {valid_hubs}.")
-    return HUB_LOCATIONS[hub_lower].copy()
+    return HUB_LOCATIONS[hub_lower]
 
 
 def filter_to_hub_locations(
@@ -297,18 +316,9 @@ def filter_to_hub_locations(
         If the DataFrame is empty, location column doesn't exist,
         or hub is invalid.
     """
-    if not isinstance(df, pl.DataFrame):
-        raise TypeError(f"Expected a Polars DataFrame; got {type(df)}.")
-    if not isinstance(location_col, str):
-        raise TypeError(
-            f"Expected a string for location_col; got {type(location_col)}."
-        )
-    if df.is_empty():
-        raise ValueError("The dataframe is empty.")
-    if location_col not in df.columns:
-        raise ValueError(
-            f"Column '{location_col}' not found in the dataframe; got {df.columns}."
-        )
-    valid_locations = get_hub_locations(hub)
-    filtered_df = df.filter(pl.col(location_col).is_in(valid_locations))
+    _validate_df_and_col(df, location_col)
+    # raises if hub is not a valid hub name
+    get_hub_locations(hub)
+    valid_locations = HUB_LOCATION_SERIES[hub.lower()]
+    filtered_df = df.filter(pl.col(location_col).is_in(valid_locations.implode()))
     return filtered_df
@@ -3,12 +3,20 @@ A collection of utility functions used
 across other forecasttools code.
 """
 
+from __future__ import annotations
+
 from collections.abc import Iterable, MutableSequence
+from typing import TYPE_CHECKING
 
-import arviz as az
 import polars as pl
 import polars.selectors as cs
-import xarray as xr
+
+if TYPE_CHECKING:
+    # only needed for annotations; importing them
+    # at runtime would make every import of
+    # forecasttools pay for arviz and xarray
+    import arviz as az
+    import xarray as xr
 
 
 def validate_input_type(value: any, expected_type: type | tuple[type], param_name: str):
@@ -0,0 +1,105 @@
+"""
+Regenerates the hardcoded location code
+lists in forecasttools/constants.py from
+forecasttools/location_table.parquet.
+
+Run after location_table.parquet changes
+and paste the printed lists into
+constants.py. With --check, exits with a
+non-zero status if constants.py has
+drifted from location_table.parquet
+instead.
+"""
+
+import argparse
+import importlib.resources
+import sys
+
+import polars as pl
+
+import forecasttools.constants
+
+
+def derive_location_codes(location_table: pl.DataFrame) -> dict[str, list[str]]:
+    """
+    Derives the location code lists that are
+    hardcoded in constants.py.
+
+    Parameters
+    ----------
+    location_table : pl.DataFrame
+        The location table, as read from
+        location_table.parquet.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        The location codes for each constant,
+        keyed by constant name.
+    """
+    codes = location_table.get_column("location_code")
+    return {
+        "ALL_LOCATION_CODES": codes.to_list(),
+        "STATE_LOCATION_CODES": (
+            codes.filter(location_table["is_state"]).sort().to_list()
+        ),
+        "TERRITORY_LOCATION_CODES": (
+            codes.filter(~location_table["is_state"] & (codes != "US")).sort().to_list()
+        ),
+    }
+
+
+def format_constant(name: str, codes: list[str], abbrs: dict[str, str]) -> str:
+    """
+    Formats a location code list as it
+    appears in constants.py, with the
+    jurisdiction abbreviation of each code
+    as a trailing comment.
+    """
+    lines = [f"{name}: list[str] = ["]
+    for code in codes:
+        comment = "United States" if code == "US" else abbrs[code]
+        lines.append(f'    "{code}",  # {comment}')
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if constants.py differs from the parquet file",
+    )
+    args = parser.parse_args()
+    location_table = pl.read_parquet(
+        importlib.resources.files("forecasttools").joinpath("location_table.parquet")
+    )
+    derived = derive_location_codes(location_table)
+    if args.check:
+        stale = [
+            name
+            for name, codes in derived.items()
+            if list(getattr(forecasttools.constants, name)) != codes
+        ]
+        if stale:
+            print(f"Out of date in constants.py: {', '.join(stale)}.")
+            return 1
+        print("constants.py is up to date.")
+        return 0
+    abbrs = dict(
+        zip(
+            location_table["location_code"].to_list(),
+            location_table["short_name"].to_list(),
+        )
+    )
+    print(
+        "\n\n".join(
+            format_constant(name, codes, abbrs) for name, codes in derived.items()
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Test file for the hardcoded location
+constants contained within constants.py
+"""
+
+import importlib.resources
+
+import polars as pl
+import pytest
+
+import forecasttools
+
+LOCATION_TABLE = pl.read_parquet(
+    importlib.resources.files("forecasttools").joinpath("location_table.parquet")
+)
+
+
+def _codes(df: pl.DataFrame) -> list[str]:
+    return df.get_column("location_code").to_list()
+
+
+@pytest.mark.parametrize(
+    "constant, expected",
+    [
+        (forecasttools.ALL_LOCATION_CODES, _codes(LOCATION_TABLE)),
+        (
+            forecasttools.STATE_LOCATION_CODES,
+            _codes(LOCATION_TABLE.filter(pl.col("is_state")).sort("location_code")),
+        ),
+        (
+            forecasttools.TERRITORY_LOCATION_CODES,
+            _codes(
+                LOCATION_TABLE.filter(
+                    ~pl.col("is_state") & (pl.col("location_code") != "US")
+                ).sort("location_code")
+            ),
+        ),
+    ],
+)
+def test_location_codes_match_location_table(constant, expected):
+    """
+    Test that the hardcoded location code
+    lists have not drifted from
+    location_table.parquet.
+    """
+    assert list(constant) == expected
+
+
+@pytest.mark.parametrize("hub", ["flusight", "covid", "rsv"])
+def test_hub_locations_match_location_table(hub):
+    """
+    Test that each hub's locations are US
+    followed by the 50 states, DC, and PR
+    from location_table.parquet in FIPS
+    order.
+    """
+    hub_codes = _codes(
+        LOCATION_TABLE.filter(
+            pl.col("is_state")
+            | pl.col("location_code").is_in(
+                [forecasttools.DC_FIPS, forecasttools.PR_FIPS]
+            )
+        ).sort("location_code")
+    )
+    assert list(forecasttools.HUB_LOCATIONS[hub]) == ["US"] + hub_codes
+    assert len(forecasttools.HUB_LOCATIONS[hub]) == 53
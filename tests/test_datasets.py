@@ -0,0 +1,118 @@
+"""
+Test file for the example datasets and
+submodules that are lazily loaded in
+forecasttools/__init__.py
+"""
+
+import subprocess
+import sys
+
+import arviz as az
+import polars as pl
+import pytest
+
+import forecasttools
+
+
+@pytest.mark.parametrize(
+    "name, expected_type",
+    [
+        ("location_table", pl.DataFrame),
+        ("united_states", list),
+        ("example_flusight_submission", pl.DataFrame),
+        ("nhsn_hosp_COVID", pl.DataFrame),
+        ("nhsn_hosp_flu", pl.DataFrame),
+        ("nhsn_flu_forecast_wo_dates", az.InferenceData),
+        ("nhsn_flu_forecast_w_dates", az.InferenceData),
+    ],
+)
+def test_lazy_dataset_loaded_and_cached(name, expected_type):
+    """
+    Test that the example datasets load on
+    access and are cached in the module
+    namespace afterwards.
+    """
+    value = getattr(forecasttools, name)
+    assert isinstance(value, expected_type)
+    assert vars(forecasttools)[name] is value
+    assert name in dir(forecasttools)
+
+
+def test_united_states_is_50_states():
+    """
+    Test that united_states contains the
+    long names of the 50 US states.
+    """
+    assert len(forecasttools.united_states) == 50
+    assert "Alabama" in forecasttools.united_states
+    assert "District of Columbia" not in forecasttools.united_states
+
+
+def test_unknown_attribute_raises():
+    """
+    Test that unknown attributes still raise
+    an AttributeError.
+    """
+    with pytest.raises(AttributeError):
+        forecasttools.not_a_dataset
+
+
+def test_import_does_not_load_arviz():
+    """
+    Test that a bare import of forecasttools
+    does not import arviz, and that the
+    forecasttools.arviz submodule is still
+    available on first access.
+    """
+    code = (
+        "import sys; import forecasttools;"
+        " assert 'arviz' not in sys.modules, 'arviz imported';"
+        " forecasttools.arviz.get_all_dims;"
+        " assert 'arviz' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_warmup_loads_datasets(monkeypatch):
+    """
+    Test that warmup loads every dataset in
+    the background and that accessing them
+    afterwards picks up those loads.
+    """
+    names = list(forecasttools._LAZY_DATA_LOADERS)
+    # drop any datasets cached by earlier tests
+    for name in names:
+        monkeypatch.delitem(vars(forecasttools), name, raising=False)
+    forecasttools.warmup()
+    assert set(forecasttools._pending_loads) == set(names)
+    for name in names:
+        assert getattr(forecasttools, name) is vars(forecasttools)[name]
+    assert not forecasttools._pending_loads
+
+
+def test_warmup_reads_location_table_once(monkeypatch):
+    """
+    Test that warmup's concurrent location_table
+    and united_states loads read
+    location_table.parquet only once and share
+    the same table.
+    """
+    read_parquet = pl.read_parquet
+    location_table_reads = []
+
+    def counting_read_parquet(source, *args, **kwargs):
+        if str(source).endswith("location_table.parquet"):
+            location_table_reads.append(source)
+        return read_parquet(source, *args, **kwargs)
+
+    monkeypatch.setattr(pl, "read_parquet", counting_read_parquet)
+    # repeat, since the loads only overlap some of the time
+    for _ in range(8):
+        location_table_reads.clear()
+        for module in (forecasttools, forecasttools.constants):
+            monkeypatch.delitem(vars(module), "location_table", raising=False)
+        monkeypatch.delitem(vars(forecasttools), "united_states", raising=False)
+        forecasttools.warmup()
+        assert forecasttools.united_states
+        assert forecasttools.location_table is forecasttools.constants.location_table
+        assert len(location_table_reads) == 1
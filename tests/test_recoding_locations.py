@@ -41,6 +41,40 @@ def test_recode_valid_location_correct_input(
     )
 
 
+@pytest.mark.parametrize(
+    "function, locations, expected_output",
+    [
+        (
+            forecasttools.loc_abbr_to_hubverse_code,
+            ["TX", "AL", "TX", "US"],
+            ["48", "01", "48", "US"],
+        ),
+        (
+            forecasttools.loc_hubverse_code_to_abbr,
+            ["48", "01", "48", "US"],
+            ["TX", "AL", "TX", "US"],
+        ),
+    ],
+)
+def test_recode_preserves_rows_and_columns(function, locations, expected_output):
+    """
+    Test that both recode functions keep the
+    row order, repeated values, and the
+    position of the location column.
+    """
+    df = pl.DataFrame(
+        {
+            "date": ["a", "b", "c", "d"],
+            "loc": locations,
+            "value": [1, 2, 3, 4],
+        }
+    )
+    result = function(df=df, location_col="loc")
+    assert result.columns == df.columns
+    assert result["loc"].to_list() == expected_output
+    assert result["value"].to_list() == [1, 2, 3, 4]
+
+
 @pytest.mark.parametrize(
     "function, df, location_col, expected_exception",
     [
@@ -104,6 +138,18 @@ def test_recode_valid_location_correct_input(
             "location",
             ValueError,
         ),
+        (
+            forecasttools.loc_abbr_to_hubverse_code,
+            pl.DataFrame({"location": ["AL", None]}),  # null value failure
+            "location",
+            ValueError,
+        ),
+        (
+            forecasttools.loc_hubverse_code_to_abbr,
+            pl.DataFrame({"location": ["01", None]}),  # null value failure
+            "location",
+            ValueError,
+        ),
     ],
 )
 def test_loc_conversation_funcs_invalid_input(
@@ -121,6 +167,24 @@ def test_loc_conversation_funcs_invalid_input(
         function(df, location_col)
 
 
+@pytest.mark.parametrize(
+    "function, invalid_value",
+    [
+        (forecasttools.loc_abbr_to_hubverse_code, "XX"),
+        (forecasttools.loc_hubverse_code_to_abbr, "99"),
+    ],
+)
+def test_recode_reports_invalid_values(function, invalid_value):
+    """
+    Test that the recode functions name the
+    invalid location values in their error,
+    even when they are repeated.
+    """
+    df = pl.DataFrame({"location": ["US", invalid_value, invalid_value]})
+    with pytest.raises(ValueError, match=invalid_value):
+        function(df, "location")
+
+
 @pytest.mark.parametrize(
     "location_format, expected_column",
     [
@@ -145,7 +209,7 @@ def test_to_location_table_column_correct_input(location_format, expected_column
 @pytest.mark.parametrize(
     "location_format, expected_exception",
     [
-        (123, AssertionError),  # invalid location type
+        (123, TypeError),  # invalid location type
         ("unknown_format", KeyError),  # bad location name
     ],
 )
@@ -194,3 +258,98 @@ def test_location_lookup_exceptions(
         assert isinstance(result, pl.DataFrame), (
             "Expected a Polars DataFrame as output."
         )
+
+
+@pytest.mark.parametrize("hub", ["flusight", "FluSight", "covid", "RSV"])
+def test_get_hub_locations_returns_shared_tuple(hub):
+    """
+    Test that get_hub_locations is case
+    insensitive and returns the immutable
+    hub location tuple without copying it.
+    """
+    locations = forecasttools.get_hub_locations(hub)
+    assert isinstance(locations, tuple)
+    assert locations is forecasttools.HUB_LOCATIONS[hub.lower()]
+    assert len(locations) == 53
+
+
+@pytest.mark.parametrize(
+    "hub, expected_exception",
+    [
+        ("invalid_hub", ValueError),  # unknown hub name
+        (123, TypeError),  # hub not a string
+    ],
+)
+def test_get_hub_locations_invalid_hub(hub, expected_exception):
+    """
+    Test get_hub_locations for exception
+    handling of invalid hub names.
+    """
+    with pytest.raises(expected_exception):
+        forecasttools.get_hub_locations(hub)
+
+
+@pytest.mark.parametrize("dtype", [pl.String, pl.Categorical])
+def test_filter_to_hub_locations(dtype):
+    """
+    Test that filter_to_hub_locations keeps
+    only rows with valid hub locations, for
+    String and Categorical location columns.
+    """
+    df = pl.DataFrame(
+        {
+            "location": ["01", "02", "72", "78", "99", "US"],
+            "value": [1, 2, 3, 4, 5, 6],
+        },
+        schema_overrides={"location": dtype},
+    )
+    result = forecasttools.filter_to_hub_locations(df, hub="flusight")
+    assert result["location"].to_list() == ["01", "02", "72", "US"]
+    assert result["value"].to_list() == [1, 2, 3, 6]
+
+
+@pytest.mark.parametrize("n_repeats", [1, 40])
+def test_location_lookup_keeps_order_and_repeats(n_repeats):
+    """
+    Test that location_lookup returns rows in
+    the order of the location vector, with
+    repeats, for both short and long vectors.
+    """
+    location_vector = ["TX", "AL", "TX", "XX"] * n_repeats
+    result = forecasttools.location_lookup(location_vector, "abbr")
+    assert result["short_name"].to_list() == ["TX", "AL", "TX"] * n_repeats
+    assert result["location_code"].to_list() == ["48", "01", "48"] * n_repeats
+
+
+@pytest.mark.parametrize(
+    "df, hub, location_col, expected_exception",
+    [
+        ("not_a_dataframe", "flusight", "location", TypeError),
+        (pl.DataFrame({"location": ["01"]}), "flusight", 123, TypeError),
+        (pl.DataFrame(), "flusight", "location", ValueError),  # empty df
+        (pl.DataFrame({"location": ["01"]}), "flusight", "loc", ValueError),
+        (pl.DataFrame({"location": ["01"]}), "invalid_hub", "location", ValueError),
+        (
+            pl.DataFrame({"location": [0, 1, 3, 52, 53, 99, 1000]}),
+            "flusight",
+            "location",
+            pl.exceptions.InvalidOperationError,
+        ),  # integer location column
+        (
+            pl.DataFrame({"location": [1.0]}),
+            "flusight",
+            "location",
+            pl.exceptions.InvalidOperationError,
+        ),
+    ],
+)
+def test_filter_to_hub_locations_invalid_input(
+    df, hub, location_col, expected_exception
+):
+    """
+    Test filter_to_hub_locations for exception
+    handling of invalid dataframes, location
+    columns, and hub names.
+    """
+    with pytest.raises(expected_exception):
+        forecasttools.filter_to_hub_locations(df, hub=hub, location_col=location_col)